@@ -1,10 +1,17 @@
+import os
 import logging
 import asyncio
+from contextlib import asynccontextmanager
 from typing import Optional, Dict, List
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# Default number of pre-opened pages kept per assistant (CODEMATE_POOL_SIZE)
+DEFAULT_POOL_SIZE = 2
+# Seconds between keep-alive pings of idle pages
+KEEPALIVE_INTERVAL = 60
+
 
 class BrowserTab(Enum):
     """Available browser tabs"""
@@ -13,76 +20,203 @@ class BrowserTab(Enum):
     CHATGPT = "ChatGPT"
 
 
+# Assistant name -> tab, keyed by the exact display name (what the frontend
+# sends) and its lower-cased form for case-insensitive lookups
+_ASSISTANT_TO_TAB = {
+    **{tab.value.lower(): tab for tab in BrowserTab},
+    **{tab.value: tab for tab in BrowserTab},
+}
+
+TAB_URLS = {
+    BrowserTab.GEMINI: "https://gemini.google.com",
+    BrowserTab.CLAUDE: "https://claude.ai",
+    BrowserTab.CHATGPT: "https://chat.openai.com",
+}
+
+
 class BrowserManager:
     """
-    Manage Playwright browser instance with three tabs
-    (Gemini, Claude, ChatGPT) for AI interactions
+    Manage Playwright browser instance with a small pool of pages
+    per AI service (Gemini, Claude, ChatGPT)
     """
 
     def __init__(self):
         """Initialize browser manager"""
+        self.playwright = None
         self.browser = None
         self.context = None
-        self.pages: Dict[BrowserTab, any] = {}
+        # False when reusing the browser's default context
+        self.owns_context = True
+        # All pooled pages per tab, and the idle ones ready to be acquired
+        self.pages: Dict[BrowserTab, List[any]] = {}
+        self.pools: Dict[BrowserTab, asyncio.Queue] = {}
+        # Pages that crashed or failed a keep-alive ping; replaced on acquire
+        self.unhealthy: set = set()
+        # Pages currently lent out through acquire(); never pinged
+        self.borrowed: set = set()
+        self.keepalive_task: Optional[asyncio.Task] = None
         self.is_running = False
 
     async def initialize(self):
         """
         Initialize browser and create tabs
 
+        If CODEMATE_CDP is set (e.g. http://localhost:9222), attach to an
+        already running browser instead of launching a new one. Set
+        CODEMATE_CDP_PORT on the primary backend to expose its browser.
+
         Note: Playwright requires installation:
         playwright install
         """
         try:
+            # Read here rather than at import so values from .env apply
+            pool_size = int(os.getenv("CODEMATE_POOL_SIZE", DEFAULT_POOL_SIZE))
+            if pool_size < 1:
+                raise ValueError(f"CODEMATE_POOL_SIZE must be at least 1, got {pool_size}")
+
             from playwright.async_api import async_playwright
 
-            # Start browser context
             self.playwright = await async_playwright().start()
-            self.browser = await self.playwright.chromium.launch(headless=True)
-            self.context = await self.browser.new_context()
-
-            # Create tabs for each AI service
-            urls = {
-                BrowserTab.GEMINI: "https://gemini.google.com",
-                BrowserTab.CLAUDE: "https://claude.ai",
-                BrowserTab.CHATGPT: "https://chat.openai.com",
-            }
-
-            for tab, url in urls.items():
-                try:
-                    page = await self.context.new_page()
-                    # Don't wait for full load, just navigate
-                    page.set_default_timeout(10000)
-                    await page.goto(url, wait_until="domcontentloaded")
-                    self.pages[tab] = page
-                    logger.info(f"Initialized {tab.value} tab")
-                except Exception as e:
-                    logger.warning(f"Failed to initialize {tab.value} tab: {str(e)}")
-                    # Continue even if one tab fails
+
+            cdp_url = os.getenv("CODEMATE_CDP")
+            if cdp_url:
+                # Share the browser launched by another backend worker
+                self.browser = await self.playwright.chromium.connect_over_cdp(cdp_url)
+                logger.info(f"Connected to shared browser at {cdp_url}")
+            else:
+                args = []
+                cdp_port = os.getenv("CODEMATE_CDP_PORT")
+                if cdp_port:
+                    args.append(f"--remote-debugging-port={cdp_port}")
+                self.browser = await self.playwright.chromium.launch(headless=True, args=args)
+
+            # Reuse the default context when there is one
+            if self.browser.contexts:
+                self.context = self.browser.contexts[0]
+                self.owns_context = False
+            else:
+                self.context = await self.browser.new_context()
+                self.owns_context = True
+
+            # Pre-open pool_size pages for each AI service concurrently
+            slots = [tab for tab in TAB_URLS for _ in range(pool_size)]
+            results = await asyncio.gather(
+                *(self._open_page(tab) for tab in slots),
+                return_exceptions=True
+            )
+
+            for tab, result in zip(slots, results):
+                if isinstance(result, Exception):
+                    # Continue even if one page fails
+                    logger.warning(f"Failed to open {tab.value} page: {str(result)}")
+                    continue
+                self.pages.setdefault(tab, []).append(result)
+                self.pools.setdefault(tab, asyncio.Queue()).put_nowait(result)
+
+            for tab, pages in self.pages.items():
+                logger.info(f"Initialized {tab.value} tab ({len(pages)} pages)")
 
             self.is_running = True
+            self.keepalive_task = asyncio.create_task(self._keep_alive())
             logger.info("Browser manager initialized successfully")
             return True, "Browser initialized with AI tabs"
         except Exception as e:
             logger.error(f"Failed to initialize browser: {str(e)}")
             return False, f"Browser initialization failed: {str(e)}"
 
-    async def get_page(self, assistant: str):
+    async def _open_page(self, tab: BrowserTab):
+        """Open a new page on the tab's AI service"""
+        page = await self.context.new_page()
+        page.on("crash", self.unhealthy.add)
+        try:
+            # Don't wait for full load, just navigate
+            page.set_default_timeout(10000)
+            await page.goto(TAB_URLS[tab], wait_until="domcontentloaded")
+        except Exception:
+            await page.close()
+            raise
+        return page
+
+    async def _recycle(self, tab: BrowserTab, page):
+        """Replace an unhealthy pooled page with a fresh one"""
+        new_page = await self._open_page(tab)
+        self.unhealthy.discard(page)
+        pages = self.pages[tab]
+        pages[pages.index(page)] = new_page
+        try:
+            if not page.is_closed():
+                await page.close()
+        except Exception as e:
+            logger.warning(f"Error closing {tab.value} page: {str(e)}")
+        logger.info(f"Recycled {tab.value} page")
+        return new_page
+
+    def get_tab(self, assistant: str) -> Optional[BrowserTab]:
         """
-        Get Playwright page for specified assistant
+        Get browser tab for specified assistant
 
         Args:
-            assistant: Assistant name (Gemini, Claude, ChatGPT)
+            assistant: Assistant name (Gemini, Claude, ChatGPT), any case
 
         Returns:
+            BrowserTab or None
+        """
+        tab = _ASSISTANT_TO_TAB.get(assistant) or _ASSISTANT_TO_TAB.get(assistant.lower())
+        if tab is None:
+            logger.warning(f"Unknown assistant: {assistant}")
+        return tab
+
+    @asynccontextmanager
+    async def acquire(self, assistant: str):
+        """
+        Borrow a Playwright page for specified assistant
+
+        Waits for an idle page, replacing it first if it is unhealthy,
+        and returns it to the pool on exit.
+
+        Args:
+            assistant: Assistant name (Gemini, Claude, ChatGPT)
+
+        Yields:
             Playwright page object or None
         """
+        tab = self.get_tab(assistant)
+
+        pool = self.pools.get(tab)
+        if pool is None:
+            yield None
+            return
+
+        page = await pool.get()
         try:
-            tab = BrowserTab[assistant.upper()]
-            return self.pages.get(tab)
-        except (KeyError, AttributeError):
-            logger.warning(f"Unknown assistant: {assistant}")
-            return None
+            if page.is_closed() or page in self.unhealthy:
+                page = await self._recycle(tab, page)
+            self.borrowed.add(page)
+            yield page
+        finally:
+            self.borrowed.discard(page)
+            pool.put_nowait(page)
+
+    async def _keep_alive(self):
+        """Periodically ping idle pooled pages and mark unresponsive ones"""
+        while self.is_running:
+            await asyncio.sleep(KEEPALIVE_INTERVAL)
+            # Don't touch pages once the browser is shutting down
+            if not self.is_running:
+                break
+            for pages in list(self.pages.values()):
+                for page in list(pages):
+                    if page.is_closed() or page in self.unhealthy or page in self.borrowed:
+                        continue
+                    try:
+                        await asyncio.wait_for(page.evaluate("1"), timeout=5)
+                    except Exception:
+                        # Borrowed during the ping: the failure may be the
+                        # borrower's work, not a dead page
+                        if page in self.borrowed:
+                            continue
+                        logger.warning("Pooled page unresponsive, will recycle")
+                        self.unhealthy.add(page)
 
     async def interact_with_ai(self, assistant: str, message: str) -> tuple[bool, str]:
         """
@@ -102,14 +236,14 @@ class BrowserManager:
         Returns:
             tuple: (success, response)
         """
-        page = await self.get_page(assistant)
-        if not page:
-            return False, f"No page available for {assistant}"
-
         try:
-            # Placeholder: actual implementation would interact with the page
-            logger.info(f"Would interact with {assistant}: {message}")
-            return True, f"Interaction prepared for {assistant}"
+            async with self.acquire(assistant) as page:
+                if not page:
+                    return False, f"No page available for {assistant}"
+
+                # Placeholder: actual implementation would interact with the page
+                logger.info(f"Would interact with {assistant}: {message}")
+                return True, f"Interaction prepared for {assistant}"
         except Exception as e:
             logger.error(f"Error interacting with {assistant}: {str(e)}")
             return False, f"Interaction failed: {str(e)}"
@@ -117,13 +251,21 @@ class BrowserManager:
     async def close(self):
         """Close browser and cleanup"""
         try:
-            if self.context:
+            self.is_running = False
+            if self.keepalive_task:
+                self.keepalive_task.cancel()
+            if self.context and self.owns_context:
                 await self.context.close()
+            else:
+                # Only close our own tabs in a shared context
+                for pages in self.pages.values():
+                    for page in pages:
+                        if not page.is_closed():
+                            await page.close()
             if self.browser:
                 await self.browser.close()
             if self.playwright:
                 await self.playwright.stop()
-            self.is_running = False
             logger.info("Browser closed")
         except Exception as e:
             logger.error(f"Error closing browser: {str(e)}")
@@ -134,8 +276,8 @@ class BrowserManager:
             return False, "Browser not initialized"
 
         active_pages = []
-        for tab, page in self.pages.items():
-            if page and not page.is_closed():
+        for tab, pages in self.pages.items():
+            if any(not page.is_closed() for page in pages):
                 active_pages.append(tab.value)
 
         if not active_pages:
@@ -1,10 +1,14 @@
 import re
 import logging
 from enum import Enum
-from typing import Optional, Dict, Any
+from typing import Optional, NamedTuple
 
 logger = logging.getLogger(__name__)
 
+# Relative paths made of [A-Za-z0-9_./-] only; rejects absolute paths,
+# "." on its own and ".." anywhere in the path
+_SAFE_PATH = re.compile(r"(?!/)(?!\.\Z)(?!.*\.\.)[\w./-]+", re.ASCII)
+
 
 class CommandType(Enum):
     """Supported command types"""
@@ -14,18 +18,26 @@ class CommandType(Enum):
     RUN = "run"
 
 
+class ParsedCommand(NamedTuple):
+    """Result of CommandParser.parse"""
+    command: Optional[CommandType]
+    filepath: str
+    content: str = ""
+
+
 class CommandParser:
     """Parse and validate commands from frontend"""
-    # Regex patterns for command validation
-    PATTERNS = {
-        CommandType.CREATE: r"^\$create\s+(.+)$",
-        CommandType.DELETE: r"^\$delete\s+(.+)$",
-        CommandType.MODIFY: r"^\$modify\s+(\S+)\s+(.*)$",
-        CommandType.RUN: r"^\$run\s+(.+)$",
+    # Command keyword -> CommandType; everything after the keyword is the
+    # filepath, except for modify where it is "<filepath> <content>"
+    _DISPATCH = {
+        "$create": CommandType.CREATE,
+        "$delete": CommandType.DELETE,
+        "$modify": CommandType.MODIFY,
+        "$run": CommandType.RUN,
     }
 
     @staticmethod
-    def parse(instruction: str) -> Dict[str, Any]:
+    def parse(instruction: str) -> ParsedCommand:
         """
         Parse instruction string into command structure
 
@@ -39,67 +51,51 @@ class CommandParser:
             instruction: Raw instruction string
 
         Returns:
-            dict with keys: command (CommandType), filepath, content (optional)
+            ParsedCommand with command (CommandType or None), filepath, content
         """
         instruction = instruction.strip()
 
-        for cmd_type, pattern in CommandParser.PATTERNS.items():
-            match = re.match(pattern, instruction)
-            if match:
-                result = {
-                    "command": cmd_type,
-                    "filepath": "",
-                    "content": ""
-                }
-
-                groups = match.groups()
-                if cmd_type == CommandType.MODIFY:
-                    result["filepath"] = groups[0].strip()
-                    result["content"] = groups[1].strip() if len(groups) > 1 else ""
-                elif cmd_type == CommandType.CREATE:
-                    result["filepath"] = groups[0].strip()
-                else:
-                    result["filepath"] = groups[0].strip()
-
-                logger.info(f"Parsed command: {cmd_type.value} -> {result['filepath']}")
-                return result
-
-        logger.warning(f"Could not parse instruction: {instruction}")
-        return {
-            "command": None,
-            "filepath": "",
-            "content": ""
-        }
+        parts = instruction.split(None, 1)
+        cmd_type = CommandParser._DISPATCH.get(parts[0]) if parts else None
+        if cmd_type:
+            filepath = parts[1] if len(parts) > 1 else ""
+            content = ""
+
+            if cmd_type == CommandType.MODIFY:
+                args = filepath.split(None, 1)
+                filepath = args[0] if args else ""
+                content = args[1].strip() if len(args) > 1 else ""
+
+            logger.info("Parsed command: %s -> %s", cmd_type.value, filepath)
+            return ParsedCommand(cmd_type, filepath, content)
+
+        logger.warning("Could not parse instruction: %s", instruction)
+        return ParsedCommand(None, "")
 
     @staticmethod
-    def validate(parsed: Dict[str, Any]) -> tuple[bool, str]:
+    def validate(parsed: ParsedCommand) -> tuple[bool, str]:
         """
         Validate parsed command
 
         Args:
-            parsed: Parsed command dictionary
+            parsed: Parsed command
 
         Returns:
             tuple: (is_valid, error_message)
         """
-        if not parsed.get("command"):
+        if not parsed.command:
             return False, "Unknown command. Use: $create, $delete, $modify, or $run"
 
-        if not parsed.get("filepath"):
-            return False, f"Missing filepath for {parsed['command'].value} command"
-
-        # Validate filepath is not empty and doesn't contain dangerous patterns
-        filepath = parsed["filepath"]
-        if not filepath or filepath == ".":
-            return False, "Invalid filepath"
+        if not parsed.filepath:
+            return False, f"Missing filepath for {parsed.command.value} command"
 
-        # Prevent directory traversal attacks
-        if ".." in filepath or filepath.startswith("/"):
-            return False, "Path traversal not allowed"
+        # Allowlist characters and prevent directory traversal attacks
+        if not _SAFE_PATH.fullmatch(parsed.filepath):
+            return False, "Invalid or unsafe filepath"
 
         # For modify, content is required
-        if parsed["command"] == CommandType.MODIFY:
-            if not parsed.get("content"):
+        if parsed.command == CommandType.MODIFY:
+            if not parsed.content:
                 return False, "Content is required for modify command"
 
         return True, ""
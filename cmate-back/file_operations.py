@@ -1,11 +1,57 @@
 import os
+import shutil
+import signal
+import asyncio
 import subprocess
+import functools
 import logging
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1024)
+def _resolve_cached(root: str, filepath: str) -> str:
+    """Resolve filepath against root, memoized since resolve() stats every component"""
+    return str((Path(root) / Path(filepath)).resolve())
+
+
+def _copy_file(src: Path, dst: Path) -> None:
+    """
+    Copy a file without moving its bytes through Python
+
+    Uses os.copy_file_range (Linux 4.5+) and falls back to
+    shutil.copyfile where the syscall is unavailable, unsupported or
+    stops short.
+
+    Args:
+        src: Source file
+        dst: Destination file (created or truncated)
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            src_fd = os.open(src, os.O_RDONLY)
+            try:
+                dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    remaining = os.fstat(src_fd).st_size
+                    while remaining > 0:
+                        copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                        if copied == 0:
+                            # Never leave a truncated copy behind as a success
+                            raise OSError(f"copy_file_range stopped with {remaining} bytes left")
+                        remaining -= copied
+                    return
+                finally:
+                    os.close(dst_fd)
+            finally:
+                os.close(src_fd)
+        except OSError as e:
+            logger.debug("copy_file_range failed, falling back: %s", e)
+
+    shutil.copyfile(src, dst)
+
+
 class FileOperations:
     """Handle file system operations safely"""
 
@@ -17,7 +63,11 @@ class FileOperations:
             workspace_root: Root directory for file operations
         """
         self.workspace_root = Path(workspace_root).resolve()
-        logger.info(f"FileOperations initialized with root: {self.workspace_root}")
+        # Cached string forms for containment checks; the trailing separator
+        # keeps /ws from matching siblings like /ws-evil
+        self._root_str = str(self.workspace_root)
+        self._root_prefix = os.path.join(self._root_str, "")
+        logger.info("FileOperations initialized with root: %s", self.workspace_root)
 
     def _resolve_safe_path(self, filepath: str) -> tuple[bool, Path]:
         """
@@ -31,17 +81,16 @@ class FileOperations:
         """
         try:
             # Resolve relative to workspace root
-            requested = Path(filepath)
-            resolved = (self.workspace_root / requested).resolve()
+            resolved_str = _resolve_cached(self._root_str, filepath)
 
             # Ensure resolved path is within workspace root
-            if not str(resolved).startswith(str(self.workspace_root)):
-                logger.warning(f"Path traversal attempt detected: {filepath}")
+            if resolved_str != self._root_str and not resolved_str.startswith(self._root_prefix):
+                logger.warning("Path traversal attempt detected: %s", filepath)
                 return False, None
 
-            return True, resolved
+            return True, Path(resolved_str)
         except Exception as e:
-            logger.error(f"Path resolution error: {str(e)}")
+            logger.error("Path resolution error: %s", e)
             return False, None
 
     def create_file(self, filepath: str, content: str = "") -> tuple[bool, str]:
@@ -63,16 +112,24 @@ class FileOperations:
             # Create parent directories if needed
             path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Check if file already exists
-            if path.exists():
+            # Create exclusively so the existence check and the open are atomic
+            data = content.encode("utf-8")
+            try:
+                fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+            except FileExistsError:
                 return False, f"File already exists: {filepath}"
 
             # Write file
-            path.write_text(content, encoding="utf-8")
-            logger.info(f"Created file: {filepath}")
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
+            logger.info("Created file: %s", filepath)
             return True, f"File created: {filepath}"
         except Exception as e:
-            logger.error(f"Error creating file: {str(e)}")
+            logger.error("Error creating file: %s", e)
             return False, f"Error creating file: {str(e)}"
 
     def delete_file(self, filepath: str) -> tuple[bool, str]:
@@ -100,10 +157,12 @@ class FileOperations:
 
             # Delete file
             path.unlink()
-            logger.info(f"Deleted file: {filepath}")
+            # Cached resolutions may refer to the deleted path
+            _resolve_cached.cache_clear()
+            logger.info("Deleted file: %s", filepath)
             return True, f"File deleted: {filepath}"
         except Exception as e:
-            logger.error(f"Error deleting file: {str(e)}")
+            logger.error("Error deleting file: %s", e)
             return False, f"Error deleting file: {str(e)}"
 
     def modify_file(self, filepath: str, content: str) -> tuple[bool, str]:
@@ -133,19 +192,80 @@ class FileOperations:
             # Backup before modifying (optional)
             try:
                 backup_path = path.with_suffix(path.suffix + ".bak")
-                backup_path.write_text(path.read_text(encoding="utf-8"), encoding="utf-8")
+                _copy_file(path, backup_path)
             except Exception as e:
-                logger.warning(f"Could not create backup: {str(e)}")
+                logger.warning("Could not create backup: %s", e)
 
             # Write new content
-            path.write_text(content, encoding="utf-8")
-            logger.info(f"Modified file: {filepath}")
+            path.write_bytes(content.encode("utf-8"))
+            logger.info("Modified file: %s", filepath)
             return True, f"File modified: {filepath}"
         except Exception as e:
-            logger.error(f"Error modifying file: {str(e)}")
+            logger.error("Error modifying file: %s", e)
             return False, f"Error modifying file: {str(e)}"
 
-    def run_file(self, filepath: str) -> tuple[bool, str]:
+    async def _kill_process_group(self, proc: asyncio.subprocess.Process, filepath: str) -> None:
+        """
+        Kill a process started by run_file together with its children
+
+        On Windows only the direct child can be killed.
+
+        Args:
+            proc: Process started in its own session
+            filepath: File being executed (for logging)
+        """
+        try:
+            if os.name == "posix":
+                os.killpg(proc.pid, signal.SIGKILL)
+            elif proc.returncode is None:
+                proc.kill()
+        except ProcessLookupError:
+            # Process group already gone
+            pass
+
+        # Bounded reap: wait() also waits for every holder of the pipes
+        try:
+            await asyncio.wait_for(proc.wait(), timeout=5)
+        except asyncio.TimeoutError:
+            logger.warning("Process for %s did not exit after kill", filepath)
+
+    def _execution_result(self, filepath: str, returncode: int, stdout: bytes, stderr: bytes) -> tuple[bool, str]:
+        """Build run_file's (success, output_message) from a finished process"""
+        output = (stdout if stdout else stderr).decode("utf-8", errors="replace")
+        logger.info("Executed file: %s (return code: %s)", filepath, returncode)
+        return returncode == 0, output or f"Execution completed with return code: {returncode}"
+
+    async def _run_in_thread(self, cmd: list[str], filepath: str) -> tuple[bool, str]:
+        """
+        Fallback for run_file when the event loop can't spawn subprocesses
+
+        On timeout only the direct child is killed, as with subprocess.run.
+
+        Args:
+            cmd: Command to execute
+            filepath: File being executed (for logging)
+
+        Returns:
+            tuple: (success, output_message)
+        """
+        try:
+            result = await asyncio.to_thread(
+                subprocess.run,
+                cmd,
+                capture_output=True,
+                timeout=30,
+                cwd=self.workspace_root
+            )
+        except subprocess.TimeoutExpired:
+            logger.error("Execution timeout: %s", filepath)
+            return False, "Execution timeout (30s limit)"
+        finally:
+            # The script may have added or removed symlinks in the workspace
+            _resolve_cached.cache_clear()
+
+        return self._execution_result(filepath, result.returncode, result.stdout, result.stderr)
+
+    async def run_file(self, filepath: str) -> tuple[bool, str]:
         """
         Execute a file
 
@@ -182,24 +302,40 @@ class FileOperations:
             else:
                 return False, f"Unsupported file type: {ext}"
 
-            # Execute with timeout (30 seconds)
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=30,
-                cwd=self.workspace_root
-            )
-
-            output = result.stdout if result.stdout else result.stderr
-            success = result.returncode == 0
-
-            logger.info(f"Executed file: {filepath} (return code: {result.returncode})")
-            return success, output or f"Execution completed with return code: {result.returncode}"
+            # Execute with timeout (30 seconds) without blocking the event loop.
+            # Own process group so the script's children can be killed with it
+            # on timeout; anything left running after a clean exit is kept.
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    cwd=self.workspace_root,
+                    start_new_session=os.name == "posix"
+                )
+            except NotImplementedError:
+                # The loop can't spawn subprocesses (Windows selector loop,
+                # installed by uvicorn --reload): run in a worker thread
+                return await self._run_in_thread(cmd, filepath)
+            try:
+                stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=30)
+            except asyncio.TimeoutError:
+                await self._kill_process_group(proc, filepath)
+                logger.error("Execution timeout: %s", filepath)
+                return False, "Execution timeout (30s limit)"
+            except asyncio.CancelledError:
+                # e.g. server shutdown: don't leave the script running
+                await self._kill_process_group(proc, filepath)
+                raise
+            finally:
+                # The script may have added or removed symlinks in the
+                # workspace. Background processes it leaves running after a
+                # clean exit (e.g. nohup ... &) can still change them later
+                # and are not covered.
+                _resolve_cached.cache_clear()
+
+            return self._execution_result(filepath, proc.returncode, stdout, stderr)
 
-        except subprocess.TimeoutExpired:
-            logger.error(f"Execution timeout: {filepath}")
-            return False, "Execution timeout (30s limit)"
         except Exception as e:
-            logger.error(f"Error executing file: {str(e)}")
+            logger.error("Error executing file: %s", e)
             return False, f"Error executing file: {str(e)}"
@@ -1,6 +1,6 @@
 import asyncio
-import json
 import logging
+import orjson
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
@@ -42,13 +42,23 @@ workspace_root = os.getenv("WORKSPACE_ROOT", ".")
 file_ops = FileOperations(workspace_root)
 browser_manager = BrowserManager()
 
+# Pre-encoded responses for constant error paths
+INVALID_JSON_RESPONSE = orjson.dumps({
+    "status": "error",
+    "message": "Invalid JSON format"
+})
+MISSING_FIELDS_RESPONSE = orjson.dumps({
+    "status": "error",
+    "message": "Missing 'assistant' or 'instruction' field"
+})
+
 
 @app.on_event("startup")
 async def startup_event():
     """Initialize browser on startup"""
     logger.info("CodeMate AI Backend starting...")
     success, message = await browser_manager.initialize()
-    logger.info(f"Browser initialization: {message}")
+    logger.info("Browser initialization: %s", message)
 
 
 @app.on_event("shutdown")
@@ -85,33 +95,27 @@ async def websocket_endpoint(websocket: WebSocket):
 
     try:
         while True:
-            # Receive message from frontend
-            data = await websocket.receive_text()
+            # Receive message from frontend; binary frames skip the UTF-8
+            # decode, text frames are still accepted
+            frame = await websocket.receive()
+            if frame["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(frame.get("code", 1000))
+            data = frame.get("bytes") or frame.get("text") or b""
 
             try:
-                message = json.loads(data)
-            except json.JSONDecodeError:
-                await websocket.send_text(
-                    json.dumps({
-                        "status": "error",
-                        "message": "Invalid JSON format"
-                    })
-                )
+                message = orjson.loads(data)
+            except orjson.JSONDecodeError:
+                await websocket.send_bytes(INVALID_JSON_RESPONSE)
                 continue
 
             # Extract fields
             assistant = message.get("assistant", "").strip()
             instruction = message.get("instruction", "").strip()
 
-            logger.info(f"Received: {assistant} -> {instruction}")
+            logger.info("Received: %s -> %s", assistant, instruction)
 
             if not assistant or not instruction:
-                await websocket.send_text(
-                    json.dumps({
-                        "status": "error",
-                        "message": "Missing 'assistant' or 'instruction' field"
-                    })
-                )
+                await websocket.send_bytes(MISSING_FIELDS_RESPONSE)
                 continue
 
             # Parse command
@@ -119,8 +123,8 @@ async def websocket_endpoint(websocket: WebSocket):
             valid, error = CommandParser.validate(parsed)
 
             if not valid:
-                await websocket.send_text(
-                    json.dumps({
+                await websocket.send_bytes(
+                    orjson.dumps({
                         "status": "error",
                         "message": error
                     })
@@ -128,27 +132,23 @@ async def websocket_endpoint(websocket: WebSocket):
                 continue
 
             # Execute command
-            command = parsed["command"]
-            filepath = parsed["filepath"]
-            content = parsed.get("content", "")
-
             response = await execute_command(
                 assistant=assistant,
-                command=command,
-                filepath=filepath,
-                content=content
+                command=parsed.command,
+                filepath=parsed.filepath,
+                content=parsed.content
             )
 
             # Send response back
-            await websocket.send_text(json.dumps(response))
+            await websocket.send_bytes(orjson.dumps(response))
 
     except WebSocketDisconnect:
         logger.info("WebSocket client disconnected")
     except Exception as e:
-        logger.error(f"WebSocket error: {str(e)}")
+        logger.error("WebSocket error: %s", e)
         try:
-            await websocket.send_text(
-                json.dumps({
+            await websocket.send_bytes(
+                orjson.dumps({
                     "status": "error",
                     "message": f"Server error: {str(e)}"
                 })
@@ -176,14 +176,15 @@ async def execute_command(
         dict: Response with status and message
     """
     try:
+        # Blocking disk I/O runs in a worker thread to keep the event loop free
         if command == CommandType.CREATE:
-            success, message = file_ops.create_file(filepath, content)
+            success, message = await asyncio.to_thread(file_ops.create_file, filepath, content)
         elif command == CommandType.DELETE:
-            success, message = file_ops.delete_file(filepath)
+            success, message = await asyncio.to_thread(file_ops.delete_file, filepath)
         elif command == CommandType.MODIFY:
-            success, message = file_ops.modify_file(filepath, content)
+            success, message = await asyncio.to_thread(file_ops.modify_file, filepath, content)
         elif command == CommandType.RUN:
-            success, message = file_ops.run_file(filepath)
+            success, message = await file_ops.run_file(filepath)
         else:
             return {
                 "status": "error",
@@ -198,7 +199,7 @@ async def execute_command(
             "filepath": filepath
         }
     except Exception as e:
-        logger.error(f"Command execution error: {str(e)}")
+        logger.error("Command execution error: %s", e)
         return {
             "status": "error",
             "message": f"Command failed: {str(e)}",
@@ -214,6 +215,8 @@ if __name__ == "__main__":
     host = os.getenv("HOST", "0.0.0.0")
     port = int(os.getenv("PORT", 8080))
     reload = os.getenv("ENV", "development") == "development"
+    # "auto" picks uvloop when it is installed (uvicorn[standard], non-Windows)
+    loop = os.getenv("EVENT_LOOP", "auto")
 
-    logger.info(f"Starting server on {host}:{port}")
-    uvicorn.run(app, host=host, port=port, reload=reload)
+    logger.info("Starting server on %s:%s (loop: %s)", host, port, loop)
+    uvicorn.run(app, host=host, port=port, reload=reload, loop=loop)